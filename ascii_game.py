@@ -1,7 +1,8 @@
 import random
+import sys
 import time
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 class Direction(Enum):
@@ -10,6 +11,10 @@ class Direction(Enum):
     EAST = "east"
     WEST = "west"
 
+# Lookup table for parsing direction commands; a dict miss is much cheaper
+# than the ValueError raised by the Direction() constructor on bad input.
+_DIR_LUT = {d.value: d for d in Direction}
+
 class ItemType(Enum):
     WEAPON = "weapon"
     ARMOR = "armor"
@@ -17,7 +22,7 @@ class ItemType(Enum):
     KEY = "key"
     TREASURE = "treasure"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Item:
     name: str
     description: str
@@ -25,30 +30,118 @@ class Item:
     damage: int = 0
     defense: int = 0
     healing: int = 0
+    _lower_name: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_lower_name", sys.intern(self.name.lower()))
+
+def _index_items(*items: Item) -> Dict[str, Item]:
+    """Index items by lowercased name for O(1) lookup in take()/use()"""
+    return {item._lower_name: item for item in items}
+
+# Item instances are immutable game data, so every game session shares this
+# single catalog instead of re-allocating the items in _create_world.
+_ITEM_CATALOG = _index_items(
+    Item("Rusty Sword", "A basic sword with some rust", ItemType.WEAPON, damage=5),
+    Item("Health Potion", "Restores 30 health", ItemType.POTION, healing=30),
+    Item("Leather Armor", "Basic leather protection", ItemType.ARMOR, defense=10),
+    Item("Gold Coins", "Shiny gold coins", ItemType.TREASURE),
+    Item("Steel Sword", "A well-crafted steel blade", ItemType.WEAPON, damage=15),
+    Item("Iron Helmet", "Protective headgear", ItemType.ARMOR, defense=8),
+    Item("Diamond Sword", "A legendary blade", ItemType.WEAPON, damage=25),
+    Item("Golden Armor", "Magnificent golden protection", ItemType.ARMOR, defense=20),
+    Item("Treasure Chest", "Filled with gold and jewels", ItemType.TREASURE)
+)
 
-@dataclass
+def _catalog_items(*names: str) -> Dict[str, Item]:
+    """Build a room's item index from catalog entries"""
+    return {name: _ITEM_CATALOG[name] for name in names}
+
+@dataclass(slots=True)
+class Enemy:
+    name: str
+    health: int
+    damage: int
+    exp: int
+
+@dataclass(slots=True)
 class Room:
     name: str
     description: str
     exits: Dict[Direction, str]
-    items: List[Item]
-    enemies: List[Dict]
+    items: Dict[str, Item]
+    enemies: List[Enemy]
     visited: bool = False
+    _exits_str: str = ""
+    _items_str: Optional[str] = None
+    _short_desc: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     health: int = 100
     max_health: int = 100
-    inventory: List[Item] = None
+    inventory: Dict[str, Item] = None
     current_room: str = "entrance"
+    current_room_ref: Optional[Room] = None
     gold: int = 0
     level: int = 1
     experience: int = 0
+    total_weapon_damage: int = 0
+    total_armor_defense: int = 0
     
     def __post_init__(self):
         if self.inventory is None:
-            self.inventory = []
+            self.inventory = {}
+
+# Static help banner, built once at import so help() returns the same
+# string object instead of re-allocating ~1KB per call.
+_HELP_TEXT = """
+╔══════════════════════════════════════════════════════════════╗
+║                           HELP                               ║
+╠══════════════════════════════════════════════════════════════╣
+║  Commands:                                                   ║
+║  - start_game [name]: Start a new game                      ║
+║  - look: Examine your surroundings                          ║
+║  - move [direction]: Move north/south/east/west             ║
+║  - take [item]: Pick up an item                             ║
+║  - inventory: Check your inventory                          ║
+║  - status: Check your health and stats                      ║
+║  - attack: Fight enemies                                    ║
+║  - use [item]: Use an item                                  ║
+║  - help: Show this help message                             ║
+║                                                              ║
+║  Game Tips:                                                 ║
+║  - Explore all rooms to find better equipment              ║
+║  - Defeat enemies to gain experience and level up          ║
+║  - Use health potions when your health is low              ║
+║  - Find the treasure room for the best loot!               ║
+╚══════════════════════════════════════════════════════════════╝
+        """
+
+# Welcome banner template; start_game() only fills in the player name and
+# the opening room description rather than formatting the whole banner.
+_WELCOME_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════╗
+║                    WELCOME TO THE CAVE!                      ║
+╠══════════════════════════════════════════════════════════════╣
+║  Greetings, {player_name}! You have entered a mysterious     ║
+║  cave filled with danger and treasure. Your quest is to     ║
+║  explore the depths and find the legendary treasure!        ║
+║                                                              ║
+║  Commands:                                                   ║
+║  - look: Examine your surroundings                          ║
+║  - move [direction]: Move north/south/east/west             ║
+║  - take [item]: Pick up an item                             ║
+║  - inventory: Check your inventory                          ║
+║  - status: Check your health and stats                      ║
+║  - attack: Fight enemies                                    ║
+║  - use [item]: Use an item                                  ║
+║  - help: Show this help message                             ║
+╚══════════════════════════════════════════════════════════════╝
+
+{room_description}
+        """
 
 class ASCIIGame:
     def __init__(self):
@@ -57,6 +150,7 @@ class ASCIIGame:
         self.game_over = False
         self.rooms = self._create_world()
         self.current_enemy = None
+        self._rng = random.Random()
         
     def _create_world(self) -> Dict[str, Room]:
         """Create the game world with rooms, items, and enemies"""
@@ -79,7 +173,7 @@ class ASCIIGame:
 ╚══════════════════════════════════════════════════════════════╝
             """,
             exits={Direction.NORTH: "main_cavern"},
-            items=[Item("Rusty Sword", "A basic sword with some rust", ItemType.WEAPON, damage=5)],
+            items=_catalog_items("rusty sword"),
             enemies=[]
         )
         
@@ -105,8 +199,8 @@ class ASCIIGame:
                 Direction.EAST: "goblin_camp",
                 Direction.WEST: "armory"
             },
-            items=[Item("Health Potion", "Restores 30 health", ItemType.POTION, healing=30)],
-            enemies=[{"name": "Cave Bat", "health": 20, "damage": 8, "exp": 15}]
+            items=_catalog_items("health potion"),
+            enemies=[Enemy("Cave Bat", health=20, damage=8, exp=15)]
         )
         
         # Goblin Camp
@@ -125,11 +219,8 @@ class ASCIIGame:
 ╚══════════════════════════════════════════════════════════════╝
             """,
             exits={Direction.WEST: "main_cavern"},
-            items=[
-                Item("Leather Armor", "Basic leather protection", ItemType.ARMOR, defense=10),
-                Item("Gold Coins", "Shiny gold coins", ItemType.TREASURE)
-            ],
-            enemies=[{"name": "Goblin Warrior", "health": 35, "damage": 12, "exp": 25}]
+            items=_catalog_items("leather armor", "gold coins"),
+            enemies=[Enemy("Goblin Warrior", health=35, damage=12, exp=25)]
         )
         
         # Armory
@@ -148,10 +239,7 @@ class ASCIIGame:
 ╚══════════════════════════════════════════════════════════════╝
             """,
             exits={Direction.EAST: "main_cavern"},
-            items=[
-                Item("Steel Sword", "A well-crafted steel blade", ItemType.WEAPON, damage=15),
-                Item("Iron Helmet", "Protective headgear", ItemType.ARMOR, defense=8)
-            ],
+            items=_catalog_items("steel sword", "iron helmet"),
             enemies=[]
         )
         
@@ -171,58 +259,58 @@ class ASCIIGame:
 ╚══════════════════════════════════════════════════════════════╝
             """,
             exits={Direction.SOUTH: "main_cavern"},
-            items=[
-                Item("Diamond Sword", "A legendary blade", ItemType.WEAPON, damage=25),
-                Item("Golden Armor", "Magnificent golden protection", ItemType.ARMOR, defense=20),
-                Item("Treasure Chest", "Filled with gold and jewels", ItemType.TREASURE)
-            ],
-            enemies=[{"name": "Dragon Guardian", "health": 100, "damage": 20, "exp": 100}]
+            items=_catalog_items("diamond sword", "golden armor", "treasure chest"),
+            enemies=[Enemy("Dragon Guardian", health=100, damage=20, exp=100)]
         )
-        
+
+        # Exits never change after world creation, so join them once here,
+        # along with the one-line summary shown on repeat visits.
+        for room in rooms.values():
+            room._exits_str = ", ".join(d.value for d in room.exits)
+            room._short_desc = f"You are in {room.name}."
+
         return rooms
     
     def start_game(self, player_name: str) -> str:
         """Start a new game with the given player name"""
         self.player = Player(name=player_name)
+        self.player.current_room_ref = self.rooms[self.player.current_room]
         self.game_started = True
         self.game_over = False
         self.current_enemy = None
         
-        return f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    WELCOME TO THE CAVE!                      ║
-╠══════════════════════════════════════════════════════════════╣
-║  Greetings, {player_name}! You have entered a mysterious     ║
-║  cave filled with danger and treasure. Your quest is to     ║
-║  explore the depths and find the legendary treasure!        ║
-║                                                              ║
-║  Commands:                                                   ║
-║  - look: Examine your surroundings                          ║
-║  - move [direction]: Move north/south/east/west             ║
-║  - take [item]: Pick up an item                             ║
-║  - inventory: Check your inventory                          ║
-║  - status: Check your health and stats                      ║
-║  - attack: Fight enemies                                    ║
-║  - use [item]: Use an item                                  ║
-║  - help: Show this help message                             ║
-╚══════════════════════════════════════════════════════════════╝
-
-{self._get_room_description()}
-        """
+        return _WELCOME_TEMPLATE.format(
+            player_name=player_name,
+            room_description=self._get_room_description()
+        )
     
+    def _spawn_enemy(self, room: Room) -> str:
+        """Spawn an enemy from the room's templates and return the alert line"""
+        # Most rooms have a single enemy template; skip the RNG for those.
+        enemies = room.enemies
+        template = enemies[0] if len(enemies) == 1 else self._rng.choice(enemies)
+        self.current_enemy = replace(template)
+        return f"⚠️  A {self.current_enemy.name} appears! (Health: {self.current_enemy.health})"
+
     def _get_room_description(self) -> str:
         """Get the current room description"""
         if not self.game_started:
             return "Game not started. Use 'start_game' to begin."
-        
-        room = self.rooms[self.player.current_room]
-        room.visited = True
-        
+
+        room = self.player.current_room_ref
+
         # Check for enemies
         if room.enemies and not self.current_enemy:
-            self.current_enemy = random.choice(room.enemies).copy()
-            return f"{room.description}\n\n⚠️  A {self.current_enemy['name']} appears! (Health: {self.current_enemy['health']})"
-        
+            alert = self._spawn_enemy(room)
+            room.visited = True
+            return f"{room.description}\n\n{alert}"
+
+        # Repeat visits to cleared rooms get the short cached summary;
+        # look() still shows the full description.
+        if room.visited and not room.enemies:
+            return room._short_desc
+
+        room.visited = True
         return room.description
     
     def look(self) -> str:
@@ -230,12 +318,21 @@ class ASCIIGame:
         if not self.game_started:
             return "Game not started. Use 'start_game' to begin."
         
-        room = self.rooms[self.player.current_room]
-        items_list = ", ".join([item.name for item in room.items]) if room.items else "None"
-        exits_list = ", ".join([exit.value for exit in room.exits.keys()])
-        
+        room = self.player.current_room_ref
+        if room._items_str is None:
+            room._items_str = ", ".join([item.name for item in room.items.values()]) if room.items else "None"
+        items_list = room._items_str
+        exits_list = room._exits_str
+
+        # Always show the full description here, only spawning an enemy if
+        # one would have appeared on entry.
+        alert = ""
+        if room.enemies and not self.current_enemy:
+            alert = f"\n\n{self._spawn_enemy(room)}"
+        room.visited = True
+
         return f"""
-{self._get_room_description()}
+{room.description}{alert}
 
 Items in room: {items_list}
 Available exits: {exits_list}
@@ -249,16 +346,16 @@ Available exits: {exits_list}
         if self.current_enemy:
             return "You cannot move while in combat! Attack or flee first."
         
-        try:
-            dir_enum = Direction(direction.lower())
-        except ValueError:
+        dir_enum = _DIR_LUT.get(direction.lower())
+        if dir_enum is None:
             return f"Invalid direction: {direction}. Use north, south, east, or west."
         
-        current_room = self.rooms[self.player.current_room]
+        current_room = self.player.current_room_ref
         if dir_enum not in current_room.exits:
             return f"You cannot go {direction} from here."
-        
+
         self.player.current_room = current_room.exits[dir_enum]
+        self.player.current_room_ref = self.rooms[self.player.current_room]
         return f"You move {direction}.\n\n{self._get_room_description()}"
     
     def take(self, item_name: str) -> str:
@@ -266,24 +363,31 @@ Available exits: {exits_list}
         if not self.game_started:
             return "Game not started. Use 'start_game' to begin."
         
-        room = self.rooms[self.player.current_room]
-        
-        for item in room.items:
-            if item.name.lower() == item_name.lower():
-                self.player.inventory.append(item)
-                room.items.remove(item)
-                
-                if item.item_type == ItemType.TREASURE:
-                    if item.name == "Gold Coins":
-                        self.player.gold += 50
-                        return f"You picked up {item.name} and gained 50 gold!"
-                    elif item.name == "Treasure Chest":
-                        self.player.gold += 200
-                        return f"You found a treasure chest! You gained 200 gold!"
-                
-                return f"You picked up {item.name}."
-        
-        return f"Item '{item_name}' not found in this room."
+        room = self.player.current_room_ref
+
+        item = room.items.pop(item_name.lower(), None)
+        if item is None:
+            return f"Item '{item_name}' not found in this room."
+
+        self.player.inventory[item._lower_name] = item
+        room._items_str = None
+
+        # Keep the running equipment totals in sync so status() and
+        # attack() read them in O(1) instead of rescanning inventory.
+        if item.item_type is ItemType.WEAPON:
+            self.player.total_weapon_damage += item.damage
+        elif item.item_type is ItemType.ARMOR:
+            self.player.total_armor_defense += item.defense
+
+        if item.item_type is ItemType.TREASURE:
+            if item.name == "Gold Coins":
+                self.player.gold += 50
+                return f"You picked up {item.name} and gained 50 gold!"
+            elif item.name == "Treasure Chest":
+                self.player.gold += 200
+                return f"You found a treasure chest! You gained 200 gold!"
+
+        return f"You picked up {item.name}."
     
     def inventory(self) -> str:
         """Show player inventory"""
@@ -293,7 +397,7 @@ Available exits: {exits_list}
         if not self.player.inventory:
             return "Your inventory is empty."
         
-        items_list = "\n".join([f"- {item.name}: {item.description}" for item in self.player.inventory])
+        items_list = "\n".join([f"- {item.name}: {item.description}" for item in self.player.inventory.values()])
         return f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                        INVENTORY                             ║
@@ -307,9 +411,9 @@ Available exits: {exits_list}
         if not self.game_started:
             return "Game not started. Use 'start_game' to begin."
         
-        # Calculate total stats from equipped items
-        total_damage = sum(item.damage for item in self.player.inventory if item.item_type == ItemType.WEAPON)
-        total_defense = sum(item.defense for item in self.player.inventory if item.item_type == ItemType.ARMOR)
+        # Total stats from equipped items, maintained incrementally by take()
+        total_damage = self.player.total_weapon_damage
+        total_defense = self.player.total_armor_defense
         
         return f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -322,7 +426,7 @@ Available exits: {exits_list}
 ║  Gold: {self.player.gold}                                    ║
 ║  Attack: {total_damage}                                      ║
 ║  Defense: {total_defense}                                    ║
-║  Current Room: {self.rooms[self.player.current_room].name}   ║
+║  Current Room: {self.player.current_room_ref.name}   ║
 ╚══════════════════════════════════════════════════════════════╝
         """
     
@@ -335,88 +439,67 @@ Available exits: {exits_list}
             return "There are no enemies to attack."
         
         # Calculate player damage
-        weapon_damage = sum(item.damage for item in self.player.inventory if item.item_type == ItemType.WEAPON)
+        weapon_damage = self.player.total_weapon_damage
         base_damage = 5
         total_damage = base_damage + weapon_damage
         
         # Player attacks enemy
-        self.current_enemy['health'] -= total_damage
-        result = f"You attack the {self.current_enemy['name']} for {total_damage} damage!"
-        
+        self.current_enemy.health -= total_damage
+        parts = [f"You attack the {self.current_enemy.name} for {total_damage} damage!"]
+
         # Check if enemy is defeated
-        if self.current_enemy['health'] <= 0:
-            exp_gained = self.current_enemy['exp']
+        if self.current_enemy.health <= 0:
+            exp_gained = self.current_enemy.exp
             self.player.experience += exp_gained
-            result += f"\nYou defeated the {self.current_enemy['name']}! Gained {exp_gained} experience."
+            parts.append(f"You defeated the {self.current_enemy.name}! Gained {exp_gained} experience.")
             self.current_enemy = None
-            
+
             # Level up check
             if self.player.experience >= self.player.level * 50:
                 self.player.level += 1
                 self.player.max_health += 20
                 self.player.health = self.player.max_health
-                result += f"\n🎉 LEVEL UP! You are now level {self.player.level}!"
-            
-            return result
-        
+                parts.append(f"🎉 LEVEL UP! You are now level {self.player.level}!")
+
+            return "\n".join(parts)
+
         # Enemy attacks back
-        enemy_damage = self.current_enemy['damage']
-        defense = sum(item.defense for item in self.player.inventory if item.item_type == ItemType.ARMOR)
+        enemy_damage = self.current_enemy.damage
+        defense = self.player.total_armor_defense
         actual_damage = max(1, enemy_damage - defense)
         self.player.health -= actual_damage
-        
-        result += f"\nThe {self.current_enemy['name']} attacks you for {actual_damage} damage!"
-        result += f"\nEnemy health: {self.current_enemy['health']}"
-        result += f"\nYour health: {self.player.health}"
-        
+
+        parts.append(f"The {self.current_enemy.name} attacks you for {actual_damage} damage!")
+        parts.append(f"Enemy health: {self.current_enemy.health}")
+        parts.append(f"Your health: {self.player.health}")
+
         # Check if player is defeated
         if self.player.health <= 0:
             self.game_over = True
-            result += "\n💀 You have been defeated! Game over."
-        
-        return result
+            parts.append("💀 You have been defeated! Game over.")
+
+        return "\n".join(parts)
     
     def use(self, item_name: str) -> str:
         """Use an item from inventory"""
         if not self.game_started:
             return "Game not started. Use 'start_game' to begin."
         
-        for item in self.player.inventory:
-            if item.name.lower() == item_name.lower():
-                if item.item_type == ItemType.POTION:
-                    if "health" in item.name.lower():
-                        self.player.health = min(self.player.max_health, self.player.health + item.healing)
-                        self.player.inventory.remove(item)
-                        return f"You used {item.name} and restored {item.healing} health!"
-                
-                return f"You cannot use {item.name} right now."
-        
-        return f"Item '{item_name}' not found in your inventory."
+        item = self.player.inventory.get(item_name.lower())
+        if item is None:
+            return f"Item '{item_name}' not found in your inventory."
+
+        if item.item_type is ItemType.POTION:
+            if "health" in item._lower_name:
+                self.player.health = min(self.player.max_health, self.player.health + item.healing)
+                del self.player.inventory[item._lower_name]
+                return f"You used {item.name} and restored {item.healing} health!"
+
+        return f"You cannot use {item.name} right now."
     
     def help(self) -> str:
         """Show help information"""
-        return """
-╔══════════════════════════════════════════════════════════════╗
-║                           HELP                               ║
-╠══════════════════════════════════════════════════════════════╣
-║  Commands:                                                   ║
-║  - start_game [name]: Start a new game                      ║
-║  - look: Examine your surroundings                          ║
-║  - move [direction]: Move north/south/east/west             ║
-║  - take [item]: Pick up an item                             ║
-║  - inventory: Check your inventory                          ║
-║  - status: Check your health and stats                      ║
-║  - attack: Fight enemies                                    ║
-║  - use [item]: Use an item                                  ║
-║  - help: Show this help message                             ║
-║                                                              ║
-║  Game Tips:                                                 ║
-║  - Explore all rooms to find better equipment              ║
-║  - Defeat enemies to gain experience and level up          ║
-║  - Use health potions when your health is low              ║
-║  - Find the treasure room for the best loot!               ║
-╚══════════════════════════════════════════════════════════════╝
-        """
+        return _HELP_TEXT
     
     def get_game_state(self) -> str:
         """Get current game state summary"""
@@ -426,8 +509,8 @@ Available exits: {exits_list}
         if self.game_over:
             return "Game Over! You have been defeated."
         
-        room = self.rooms[self.player.current_room]
-        enemy_info = f"\nEnemy: {self.current_enemy['name']} (Health: {self.current_enemy['health']})" if self.current_enemy else ""
+        room = self.player.current_room_ref
+        enemy_info = f"\nEnemy: {self.current_enemy.name} (Health: {self.current_enemy.health})" if self.current_enemy else ""
         
         return f"""
 Location: {room.name}